@@ -1,5 +1,7 @@
 import os
-from PIL import Image, ImageDraw, ImageEnhance
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from PIL import Image
 import math # For math.ceil or math.round
 import re # For sanitizing filenames
 
@@ -39,6 +41,10 @@ FORCE_STANDARD_FRAME_TYPE = False # Default is False (use automatic detection)
 BLACK_BORDER_THRESHOLD = 50 # RGB values must all be <= this to be considered 'black'
 EDGE_ZONE_CHECK_WIDTH_PX = 10  # Pixel width of edge zones to check for solid black
 EXTENDED_ART_SCAN_OFFSET_Y_MM = 3 # Vertical offset in mm for Extended Art side content detection
+# Border detection only needs ~1 mm precision, so analysis runs on an image
+# downsampled by this factor (6 => ~200 DPI for 1200 DPI scans). Set to 1 to
+# analyze at full resolution.
+ANALYSIS_DOWNSAMPLE_FACTOR = 6
 
 ########################################################################
 # --- NORMAL USERS SHOULD NOT EDIT BELOW THIS LINE! ---
@@ -56,6 +62,10 @@ BORDER_LEFT_PX = round((DESIRED_BORDER_LEFT_MM * MM_TO_IN) * DPI)
 BORDER_RIGHT_PX = round((DESIRED_BORDER_RIGHT_MM * MM_TO_IN) * DPI)
 BORDER_BOTTOM_PX = round((DESIRED_BORDER_BOTTOM_MM * MM_TO_IN) * DPI)
 
+# Per-side border sizes as one array (top, left, right, bottom) so resize_card
+# can scale all four sides in a single vectorized call.
+BORDER_SIDES_PX = np.array([BORDER_TOP_PX, BORDER_LEFT_PX, BORDER_RIGHT_PX, BORDER_BOTTOM_PX])
+
 EXTENDED_ART_SCAN_OFFSET_Y_PX = round(EXTENDED_ART_SCAN_OFFSET_Y_MM * MM_TO_IN * DPI)
 
 PAPER_WIDTH_PX = round(PAPER_WIDTH_IN * DPI)
@@ -71,164 +81,91 @@ if MARGIN_X < 0 or MARGIN_Y < 0:
   MARGIN_X = max(0, MARGIN_X)
   MARGIN_Y = max(0, MARGIN_Y)
 
-def get_content_bounding_box(image, threshold):
+def compute_content_mask(rgb_array, threshold):
+  """
+  Builds the boolean content mask for an (H, W, 3) uint8 array: True where
+  any channel is brighter than the threshold. All analysis helpers below
+  operate on this mask, so it is computed once per card.
+  """
+  return (rgb_array > threshold).any(axis=2)
+
+def get_content_bounding_box(content_mask):
   """
-  Calculates the bounding box of the content area by identifying pixels
-  brighter than the threshold.
+  Calculates the bounding box of the content area from the boolean mask.
   Returns a tuple (x0, y0, x1, y1) for the bounding box of content,
   or None if no content found (e.g., image is all border color or empty).
   """
-  original_size = image.size
-  image_width = image.width
-  image_height = image.height
-
-  if image_width == 0 or image_height == 0:
+  if content_mask.size == 0:
     return None
 
-  temp_l_image_full = Image.new("L", original_size, 0) # All black
-  try:
-    # Ensure image is RGB for consistent pixel reading
-    source_img_rgb = image
-    if image.mode != 'RGB':
-        source_img_rgb = image.convert("RGB")
-    source_pixels_full_rgb = source_img_rgb.load()
-  except Exception as e:
-    print(f"    Error in get_content_bounding_box pixel conversion: {e}")
-    return None
-    
-  dest_pixels_full_l = temp_l_image_full.load()
-  has_any_content_pixel = False
-  for y_f in range(image_height):
-    for x_f in range(image_width):
-      r, g, b = source_pixels_full_rgb[x_f, y_f] # Will be 3-tuple
-      if r > threshold or g > threshold or b > threshold: # If content
-        dest_pixels_full_l[x_f, y_f] = 255 # Mark as white
-        has_any_content_pixel = True
-            
-  if not has_any_content_pixel:
+  rows = content_mask.any(axis=1)
+  cols = content_mask.any(axis=0)
+  if not rows.any():
     return None # Entire image is "border" color or darker
 
-  return temp_l_image_full.getbbox() # Bbox of white pixels
+  y0 = int(np.argmax(rows))
+  y1 = len(rows) - int(np.argmax(rows[::-1]))
+  x0 = int(np.argmax(cols))
+  x1 = len(cols) - int(np.argmax(cols[::-1]))
 
-def get_content_extents_at_row(image, y_row, threshold):
+  return (x0, y0, x1, y1)
+
+def get_content_extents_at_row(content_mask, y_row):
   """
-  Finds the start and end x-coordinates of content on a specific row.
-  Content is defined by pixels brighter than the threshold.
-  Assumes image is already in a mode like RGBA or RGB for pixel access.
+  Finds the start and end x-coordinates of content on a specific row of the
+  boolean mask.
   Returns (content_start_x, content_end_x) or (None, None) if no content found.
   """
-  try:
-    pixels = image.load() # pixels[x,y]
-    width = image.width
-  except Exception as e:
-    print(f"    Error loading image pixels in get_content_extents_at_row: {e}")
-    return None, None
-
-  content_start_x = -1
-  # Scan from left for content_start_x
-  for x in range(width):
-    pixel_tuple = pixels[x, y_row]
-    r, g, b = pixel_tuple[:3] # Access first 3 for RGB, handles RGB and RGBA
-    if r > threshold or g > threshold or b > threshold:
-      content_start_x = x
-      break
-  
-  if content_start_x == -1:
+  row = content_mask[y_row]
+  if not row.any():
     # No content found on this row
     return None, None
 
-  content_end_x = content_start_x # Initialize with start_x, in case only one content pixel found
-  # Scan from right for content_end_x (no need to scan more left than content_start_x)
-  for x in range(width - 1, content_start_x - 1, -1):
-    pixel_tuple = pixels[x, y_row]
-    r, g, b = pixel_tuple[:3]
-    if r > threshold or g > threshold or b > threshold:
-      content_end_x = x
-      break
-  
+  content_start_x = int(np.argmax(row))
+  content_end_x = len(row) - 1 - int(np.argmax(row[::-1]))
   return content_start_x, content_end_x
 
-def check_strip_for_solid_lr_border(strip_image, check_width_px, threshold):
+def check_strip_for_solid_lr_border(strip_mask, check_width_px):
   """
-  Checks if a horizontal image strip has solid black borders on its left and right sides.
+  Checks if a horizontal strip of the boolean content mask has solid black
+  borders on its left and right sides.
   """
-  if not strip_image or strip_image.height == 0 or strip_image.width < 2 * check_width_px:
+  if strip_mask.shape[0] == 0 or strip_mask.shape[1] < 2 * check_width_px:
     return False
 
-  try:
-    # Ensure strip_image is in a suitable mode (e.g. RGBA or RGB) before loading pixels
-    if strip_image.mode not in ['RGB', 'RGBA']:
-        strip_image_conv = strip_image.convert('RGBA') # Convert to RGBA for consistent pixel access
-    else:
-        strip_image_conv = strip_image
-    strip_pixels = strip_image_conv.load()
-  except Exception as e:
-    # print(f"    Debug: Error converting strip or loading pixels: {e}")
-    return False 
-    
-  strip_h = strip_image_conv.height
-  strip_w = strip_image_conv.width
-
-  left_border_is_solid = True
-  if check_width_px > 0:
-    for x_coord in range(check_width_px):
-      for y_coord in range(strip_h):
-        pixel_tuple = strip_pixels[x_coord, y_coord]
-        r, g, b = pixel_tuple[:3]
-        if r > threshold or g > threshold or b > threshold:
-          left_border_is_solid = False
-          break
-      if not left_border_is_solid:
-        break
-  else: # No width to check, so technically no border defined by this check
-    left_border_is_solid = False
-  
-  if not left_border_is_solid:
-    return False # No need to check right if left failed
-
-  right_border_is_solid = True
-  if check_width_px > 0: # Only check if check_width_px is positive
-    for x_coord in range(strip_w - check_width_px, strip_w):
-      for y_coord in range(strip_h):
-        pixel_tuple = strip_pixels[x_coord, y_coord]
-        r, g, b = pixel_tuple[:3]
-        if r > threshold or g > threshold or b > threshold:
-          right_border_is_solid = False
-          break
-      if not right_border_is_solid:
-        break
-  else: # No width to check
-    right_border_is_solid = False
-            
-  return left_border_is_solid and right_border_is_solid
+  if check_width_px <= 0: # No width to check, so technically no border defined by this check
+    return False
 
-def determine_card_type(image, threshold, edge_check_pixel_width):
+  # An edge zone is a solid border only if it contains no content pixels.
+  return not strip_mask[:, :check_width_px].any() and not strip_mask[:, -check_width_px:].any()
+
+def determine_card_type(content_mask, edge_check_pixel_width):
   """
-  Determines card type based on analyzing borders in top and middle zones.
-  Assumes image is already RGBA or RGB.
+  Determines card type based on analyzing borders in top and middle zones
+  of the boolean content mask.
   """
-  width, height = image.size
+  height = content_mask.shape[0]
   if height < 20: # Arbitrary minimum height to define zones meaningfully
     return "borderless"
 
   min_zone_height = max(1, edge_check_pixel_width // 2 if edge_check_pixel_width > 0 else 1)
 
   top_zone_actual_height = max(min_zone_height, int(height * 0.05))
-  top_zone_img = image.crop((0, 0, width, top_zone_actual_height))
+  top_zone = content_mask[:top_zone_actual_height]
 
   middle_zone_top_y = int(height * 0.50)
   middle_zone_bottom_y = int(height * 0.60)
   middle_zone_calculated_height = middle_zone_bottom_y - middle_zone_top_y
   middle_zone_actual_height = max(min_zone_height, middle_zone_calculated_height)
-  
+
   if middle_zone_actual_height == min_zone_height and middle_zone_calculated_height < min_zone_height:
-    if middle_zone_top_y + middle_zone_actual_height > height: # Avoid cropping beyond image
+    if middle_zone_top_y + middle_zone_actual_height > height: # Avoid slicing beyond image
       middle_zone_top_y = max(0, height - middle_zone_actual_height)
 
-  middle_zone_img = image.crop((0, middle_zone_top_y, width, middle_zone_top_y + middle_zone_actual_height))
-  
-  top_has_lr_border = check_strip_for_solid_lr_border(top_zone_img, edge_check_pixel_width, threshold)
-  middle_has_lr_border = check_strip_for_solid_lr_border(middle_zone_img, edge_check_pixel_width, threshold)
+  middle_zone = content_mask[middle_zone_top_y : middle_zone_top_y + middle_zone_actual_height]
+
+  top_has_lr_border = check_strip_for_solid_lr_border(top_zone, edge_check_pixel_width)
+  middle_has_lr_border = check_strip_for_solid_lr_border(middle_zone, edge_check_pixel_width)
   
   if top_has_lr_border and middle_has_lr_border:
     return "standard"
@@ -237,27 +174,89 @@ def determine_card_type(image, threshold, edge_check_pixel_width):
   else: # Neither, or only middle (which defaults to borderless as per rule "If neither...")
     return "borderless"
 
+def apply_color_enhancements(image):
+  """
+  Applies BRIGHTNESS_FACTOR and SATURATION_FACTOR in a single vectorized
+  pass over the image, instead of one full-image walk per ImageEnhance
+  step. Returns the image unchanged when both factors are 1.0.
+  """
+  if BRIGHTNESS_FACTOR == 1.0 and SATURATION_FACTOR == 1.0:
+    return image
+
+  arr = np.asarray(image, dtype=np.float32)
+  rgb = arr[..., :3]
+  # ImageEnhance.Color interpolates between the grayscale (luminance) image
+  # and the original; brightness then scales toward black. Same math, fused.
+  luminance = (0.299 * rgb[..., 0] + 0.587 * rgb[..., 1] + 0.114 * rgb[..., 2])[..., None]
+  arr[..., :3] = (luminance + (rgb - luminance) * SATURATION_FACTOR) * BRIGHTNESS_FACTOR
+  np.clip(arr, 0.0, 255.0, out=arr)
+  return Image.fromarray(arr.astype(np.uint8), mode=image.mode)
+
 def resize_card(image_path, target_final_card_width_px, target_final_card_height_px):
   try:
     original_img = Image.open(image_path)
-    original_img = original_img.convert("RGBA") # Ensure consistent RGBA mode for all operations
+    # For oversized JPEGs, ask libjpeg to DCT-scale during decode (1/2, 1/4,
+    # 1/8). draft() never goes below the requested size, so 2x the target
+    # keeps plenty of resolution for the final LANCZOS resize.
+    if original_img.format == 'JPEG' and (
+        original_img.width >= 2 * target_final_card_width_px
+        and original_img.height >= 2 * target_final_card_height_px):
+      original_img.draft('RGB', (2 * target_final_card_width_px, 2 * target_final_card_height_px))
+    if 'A' in original_img.getbands() or 'transparency' in original_img.info:
+      # Transparent inputs (including palettized PNGs/GIFs with a
+      # transparency entry) used to be pasted onto the white sheet through
+      # their alpha mask; composite over white here to reproduce that before
+      # dropping the alpha channel.
+      # Detection keeps reading the stored RGB values (where transparent
+      # corners are typically black, i.e. "border"), exactly as the old
+      # RGBA-based analysis did.
+      rgba_img = original_img.convert("RGBA")
+      analysis_source_img = rgba_img.convert("RGB")
+      white_background = Image.new("RGBA", rgba_img.size, (255, 255, 255, 255))
+      original_img = Image.alpha_composite(white_background, rgba_img).convert("RGB")
+    else:
+      original_img = original_img.convert("RGB") # Cards are opaque from here; RGB keeps every buffer 25% smaller than RGBA
+      analysis_source_img = original_img
     original_w, original_h = original_img.size
     print(f"Processing {os.path.basename(image_path)} (Original size: {original_w}x{original_h})...")
 
+    # Detection runs on a downsampled copy: borders only need to be located
+    # to ~1 mm, and the smaller image cuts analysis work by factor^2.
+    analysis_factor = ANALYSIS_DOWNSAMPLE_FACTOR
+    if original_w < 2 * analysis_factor or original_h < 2 * analysis_factor:
+      analysis_factor = 1 # Too small to be worth downsampling
+    if analysis_factor > 1:
+      # reduce() is an exact integer box filter in C — cheaper than resize()
+      # and plenty accurate for locating borders.
+      analysis_img = analysis_source_img.reduce(analysis_factor)
+    else:
+      analysis_img = analysis_source_img
+
+    # Single boolean content mask shared by all analysis helpers: 1 byte per
+    # pixel instead of 3, and every query below becomes a C-level reduction.
+    content_mask = compute_content_mask(
+        np.asarray(analysis_img, dtype=np.uint8), BLACK_BORDER_THRESHOLD)
+    edge_check_width = max(1, EDGE_ZONE_CHECK_WIDTH_PX // analysis_factor)
+
     # --- MODIFIED SECTION: Card Type Determination ---
     if FORCE_STANDARD_FRAME_TYPE:
       card_type = "standard"
       print(f"  Config override: Treating card as '{card_type}' type.")
     else:
-      card_type = determine_card_type(original_img, BLACK_BORDER_THRESHOLD, EDGE_ZONE_CHECK_WIDTH_PX)
+      card_type = determine_card_type(content_mask, edge_check_width)
       print(f"  Detected card type: {card_type}")
     # --- END OF MODIFIED SECTION ---
 
-    img_to_final_resize = None # This will hold the image after initial cropping, before final resize
     image_ready_for_enhancement = None # This will hold the image at final dimensions, before enhancement
 
     # Get overall content box first; used for cy0, cy1 and as fallback for cx0, cx1 for Standard/Extended.
-    overall_content_bbox = get_content_bounding_box(original_img, BLACK_BORDER_THRESHOLD)
+    overall_content_bbox = get_content_bounding_box(content_mask)
+    if overall_content_bbox and analysis_factor > 1:
+      # Scale the detected box back up to original-image coordinates.
+      bx0, by0, bx1, by1 = overall_content_bbox
+      overall_content_bbox = (bx0 * analysis_factor, by0 * analysis_factor,
+                              min(original_w, bx1 * analysis_factor),
+                              min(original_h, by1 * analysis_factor))
 
     # Initialize effective content coordinates
     # These will be used for Standard/Extended art border processing
@@ -279,12 +278,16 @@ def resize_card(image_path, target_final_card_width_px, target_final_card_height
 
         if 0 <= vertical_sample_y < original_h:
           print(f"    Extended Art: Scanning for side content at y={vertical_sample_y} (content_top_y={content_top_y_for_scan} + {EXTENDED_ART_SCAN_OFFSET_Y_PX}px offset)")
-          cx_at_row_start, cx_at_row_end = get_content_extents_at_row(original_img, vertical_sample_y, BLACK_BORDER_THRESHOLD)
+          sample_row = min(vertical_sample_y // analysis_factor, content_mask.shape[0] - 1)
+          cx_at_row_start, cx_at_row_end = get_content_extents_at_row(content_mask, sample_row)
+          if cx_at_row_start is not None:
+            cx_at_row_start = cx_at_row_start * analysis_factor
+            cx_at_row_end = min(original_w - 1, cx_at_row_end * analysis_factor)
 
           if cx_at_row_start is not None and cx_at_row_end is not None and cx_at_row_start <= cx_at_row_end:
             print(f"      Found side content at y={vertical_sample_y} from x={cx_at_row_start} to x={cx_at_row_end}")
-            effective_cx0 = cx_at_row_start 
-            effective_cx1 = cx_at_row_end   
+            effective_cx0 = cx_at_row_start
+            effective_cx1 = cx_at_row_end
           else:
             print(f"      Warning: Could not determine specific side content for Extended Art at y={vertical_sample_y}. Using overall content box for sides.")
         else:
@@ -309,80 +312,75 @@ def resize_card(image_path, target_final_card_width_px, target_final_card_height
         scale_w = final_artwork_width / current_content_width_orig if current_content_width_orig != 0 else 0
         scale_h = final_artwork_height / current_content_height_orig if current_content_height_orig != 0 else 0
         
-        keep_orig_border_left_px = round(BORDER_LEFT_PX / scale_w) if abs(scale_w) > 1e-6 else 0
-        keep_orig_border_top_px = round(BORDER_TOP_PX / scale_h) if abs(scale_h) > 1e-6 else 0
-        keep_orig_border_right_px = round(BORDER_RIGHT_PX / scale_w) if abs(scale_w) > 1e-6 else 0
-        keep_orig_border_bottom_px = round(BORDER_BOTTOM_PX / scale_h) if abs(scale_h) > 1e-6 else 0
-        
+        # How much of the original border to keep on each side (top, left,
+        # right, bottom), computed for all four sides at once.
+        side_scales = np.array([scale_h, scale_w, scale_w, scale_h])
+        with np.errstate(divide='ignore', invalid='ignore'):
+          keep_orig_borders_px = np.round(BORDER_SIDES_PX / side_scales)
+        keep_orig_borders_px = np.where(np.abs(side_scales) > 1e-6, keep_orig_borders_px, 0).astype(int)
+        (keep_orig_border_top_px, keep_orig_border_left_px,
+         keep_orig_border_right_px, keep_orig_border_bottom_px) = keep_orig_borders_px
+
+
         crop_x0 = max(0, effective_cx0 - keep_orig_border_left_px)
         crop_y0 = max(0, effective_cy0 - keep_orig_border_top_px)
         crop_x1 = min(original_w, effective_cx1 + keep_orig_border_right_px)
         crop_y1 = min(original_h, effective_cy1 + keep_orig_border_bottom_px)
 
         if crop_x1 > crop_x0 and crop_y1 > crop_y0:
-          img_to_final_resize = original_img.crop((crop_x0, crop_y0, crop_x1, crop_y1))
-        else: 
+          crop_box = (crop_x0, crop_y0, crop_x1, crop_y1)
+        else:
           print(f"    Warning: Calculated proportional crop for '{card_type}' is invalid.")
           if effective_cx0 >= 0 and effective_cy0 >=0 and effective_cx1 > effective_cx0 and effective_cy1 > effective_cy0:
-            print(f"      Falling back to cropping to effective content box: ({effective_cx0},{effective_cy0},{effective_cx1},{effective_cy1})")
-            img_to_final_resize = original_img.crop((effective_cx0, effective_cy0, effective_cx1, effective_cy1))
-          else: 
-            print(f"      Falling back to using full original image (copy).")
-            img_to_final_resize = original_img.copy() 
-      else: 
-        print(f"    Warning: Effective content box for '{card_type}' has zero/negative dimension. Using full original image (copy).")
-        img_to_final_resize = original_img.copy()
-      
-      if img_to_final_resize:
-        if img_to_final_resize.size != (target_final_card_width_px, target_final_card_height_px):
-          image_ready_for_enhancement = img_to_final_resize.resize(
-              (target_final_card_width_px, target_final_card_height_px), 
-              Image.Resampling.LANCZOS
-          )
-        else:
-          image_ready_for_enhancement = img_to_final_resize.copy()
+            print(f"      Falling back to effective content box: ({effective_cx0},{effective_cy0},{effective_cx1},{effective_cy1})")
+            crop_box = (effective_cx0, effective_cy0, effective_cx1, effective_cy1)
+          else:
+            print(f"      Falling back to using full original image.")
+            crop_box = (0, 0, original_w, original_h)
+      else:
+        print(f"    Warning: Effective content box for '{card_type}' has zero/negative dimension. Using full original image.")
+        crop_box = (0, 0, original_w, original_h)
+
+      # Crop and resize in one fused Pillow pass (no intermediate cropped image).
+      image_ready_for_enhancement = original_img.resize(
+          (target_final_card_width_px, target_final_card_height_px),
+          Image.Resampling.LANCZOS, box=crop_box, reducing_gap=3.0
+      )
 
     # --- Process Full Art (Borderless) Cards ---
     # This block will be skipped if FORCE_STANDARD_FRAME_TYPE is True.
     elif card_type == "borderless":
-      img_for_full_art_processing = original_img.copy() 
-      if FULL_ART_BOTTOM_CROP_PX > 0:
+      source_for_full_art = original_img
+      if original_w == 0 or original_h == 0:
+        print(f"    Warning: Original image has a zero dimension for Full Art. Creating 1x1 black pixel.")
+        source_for_full_art = Image.new("RGB", (1, 1), (0,0,0))
+        full_art_box = (0, 0, 1, 1)
+      elif FULL_ART_BOTTOM_CROP_PX > 0:
         print(f"  Action: Full Art - cropping {FULL_ART_BOTTOM_CROP_PX}px from original bottom, then resizing.")
-        if FULL_ART_BOTTOM_CROP_PX >= original_h :
+        if FULL_ART_BOTTOM_CROP_PX >= original_h:
           print(f"    Warning: Full art bottom trim amount ({FULL_ART_BOTTOM_CROP_PX}px) meets or exceeds image height ({original_h}px). Cropping to 1px height.")
-          img_for_full_art_processing = original_img.crop((0, 0, original_w, 1)) if original_h > 0 else Image.new("RGBA", (max(1, original_w), 1), (0,0,0,0))
-        elif original_w > 0 :
-          crop_bottom_y = max(1, original_h - FULL_ART_BOTTOM_CROP_PX)
-          img_for_full_art_processing = original_img.crop((0, 0, original_w, crop_bottom_y))
-        elif original_w == 0:
-            print(f"    Warning: Original image width is 0 for Full Art. Creating 1x1 transparent pixel.")
-            img_for_full_art_processing = Image.new("RGBA",(1,1),(0,0,0,0))
-      else: 
+          full_art_box = (0, 0, original_w, 1)
+        else:
+          full_art_box = (0, 0, original_w, max(1, original_h - FULL_ART_BOTTOM_CROP_PX))
+      else:
         print(f"  Action: Full Art - resizing as-is (FULL_ART_BOTTOM_CROP_PX is 0).")
+        full_art_box = (0, 0, original_w, original_h)
 
-      if img_for_full_art_processing.size != (target_final_card_width_px, target_final_card_height_px):
-        image_ready_for_enhancement = img_for_full_art_processing.resize(
-            (target_final_card_width_px, target_final_card_height_px), 
-            Image.Resampling.LANCZOS
-        )
-      else:
-        image_ready_for_enhancement = img_for_full_art_processing.copy()
+      image_ready_for_enhancement = source_for_full_art.resize(
+          (target_final_card_width_px, target_final_card_height_px),
+          Image.Resampling.LANCZOS, box=full_art_box, reducing_gap=3.0
+      )
             
     if not image_ready_for_enhancement: 
-      print(f"  Fallback Error: Image for enhancement not set for {os.path.basename(image_path)}. Resizing original (copy).")
-      image_ready_for_enhancement = original_img.copy().resize(
-          (target_final_card_width_px, target_final_card_height_px), 
-          Image.Resampling.LANCZOS
+      print(f"  Fallback Error: Image for enhancement not set for {os.path.basename(image_path)}. Resizing original.")
+      image_ready_for_enhancement = original_img.resize(
+          (target_final_card_width_px, target_final_card_height_px),
+          Image.Resampling.LANCZOS, reducing_gap=3.0
       )
 
-    image_after_enhancements = image_ready_for_enhancement
-    if BRIGHTNESS_FACTOR != 1.0:
-      enhancer_brightness = ImageEnhance.Brightness(image_after_enhancements)
-      image_after_enhancements = enhancer_brightness.enhance(BRIGHTNESS_FACTOR)
-    if SATURATION_FACTOR != 1.0:
-      enhancer_color = ImageEnhance.Color(image_after_enhancements)
-      image_after_enhancements = enhancer_color.enhance(SATURATION_FACTOR)
-    
+    image_after_enhancements = apply_color_enhancements(image_ready_for_enhancement)
+
+
     print(f"  Finished processing {os.path.basename(image_path)} -> Final card size {image_after_enhancements.size}")
     return image_after_enhancements
 
@@ -395,49 +393,65 @@ def resize_card(image_path, target_final_card_width_px, target_final_card_height
     traceback.print_exc() 
     return None
 
+def resize_card_worker(image_path):
+  """Module-level wrapper so ProcessPoolExecutor can pickle the call."""
+  return resize_card(image_path, CARD_WIDTH_PX, CARD_HEIGHT_PX)
+
 def create_printable_sheet(image_file_paths_chunk, output_path_for_sheet):
   print(f"Creating sheet: {os.path.basename(output_path_for_sheet)}")
-  sheet = Image.new('RGBA', (PAPER_WIDTH_PX, PAPER_HEIGHT_PX), (255, 255, 255, 255))
-  draw = ImageDraw.Draw(sheet)
-  current_image_index = 0
-  for row in range(3):
-    for col in range(3):
-      if current_image_index < len(image_file_paths_chunk):
-        image_path = image_file_paths_chunk[current_image_index]
-        card_img = resize_card(image_path, CARD_WIDTH_PX, CARD_HEIGHT_PX) 
-        if card_img:
-          paste_x_sheet = MARGIN_X + col * CARD_WIDTH_PX
-          paste_y_sheet = MARGIN_Y + row * CARD_HEIGHT_PX
-          sheet.paste(card_img, (paste_x_sheet, paste_y_sheet), card_img if card_img.mode == 'RGBA' else None)
-        current_image_index += 1
-      else: 
-        break
-    if current_image_index >= len(image_file_paths_chunk): 
-      break
-
-  for col_idx in range(1, 3): 
-    line_x = MARGIN_X + col_idx * CARD_WIDTH_PX
-    draw.line([(line_x - LINE_WIDTH // 2, 0), 
-               (line_x - LINE_WIDTH // 2, PAPER_HEIGHT_PX)], 
-              fill=LINE_COLOR, width=LINE_WIDTH)
-  for row_idx in range(1, 3): 
-    line_y = MARGIN_Y + row_idx * CARD_HEIGHT_PX
-    draw.line([(0, line_y - LINE_WIDTH // 2), 
-               (PAPER_WIDTH_PX, line_y - LINE_WIDTH // 2)], 
-              fill=LINE_COLOR, width=LINE_WIDTH)
+  # The sheet lives as a uint8 array: each card opaquely replaces its grid
+  # cell, so a plain slice copy avoids Pillow's general alpha-composite paste.
+  sheet_np = np.full((PAPER_HEIGHT_PX, PAPER_WIDTH_PX, 4), 255, dtype=np.uint8)
+
+  # Each card is independent and CPU-bound (analysis + LANCZOS resize), so
+  # process them across cores and paste sequentially in the main process.
+  with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+    card_images = list(executor.map(resize_card_worker, image_file_paths_chunk))
+
+  for card_index, card_img in enumerate(card_images[:9]):
+    if card_img:
+      row, col = divmod(card_index, 3)
+      paste_x_sheet = MARGIN_X + col * CARD_WIDTH_PX
+      paste_y_sheet = MARGIN_Y + row * CARD_HEIGHT_PX
+      if card_img.mode != 'RGB': # Cards come back RGB; flatten anything unexpected
+        card_img = card_img.convert('RGB')
+      card_arr = np.asarray(card_img, dtype=np.uint8)
+      card_h = min(card_arr.shape[0], sheet_np.shape[0] - paste_y_sheet)
+      card_w = min(card_arr.shape[1], sheet_np.shape[1] - paste_x_sheet)
+      sheet_np[paste_y_sheet : paste_y_sheet + card_h,
+               paste_x_sheet : paste_x_sheet + card_w, :3] = card_arr[:card_h, :card_w]
+
+  # Cut lines are axis-aligned full-span rectangles, so write them directly
+  # into the array: a memset-speed fill per line, no rasterizer involved.
+  # ImageDraw.line filled [c - (LINE_WIDTH - 1) // 2, c + LINE_WIDTH // 2]
+  # around the stroke center c; keep that placement for odd and even widths.
+  for col_idx in range(1, 3):
+    line_x = MARGIN_X + col_idx * CARD_WIDTH_PX - LINE_WIDTH // 2
+    x0 = max(0, line_x - (LINE_WIDTH - 1) // 2)
+    sheet_np[:, x0 : x0 + LINE_WIDTH, :3] = LINE_COLOR
+  for row_idx in range(1, 3):
+    line_y = MARGIN_Y + row_idx * CARD_HEIGHT_PX - LINE_WIDTH // 2
+    y0 = max(0, line_y - (LINE_WIDTH - 1) // 2)
+    sheet_np[y0 : y0 + LINE_WIDTH, :, :3] = LINE_COLOR
+
+  sheet = Image.fromarray(sheet_np, mode='RGBA')
   try:
-    sheet.save(output_path_for_sheet, dpi=(DPI, DPI))
+    # Sheets are throwaway print targets, so trade ~20% larger files for a
+    # much cheaper zlib pass (level 1 instead of the default 6).
+    sheet.save(output_path_for_sheet, dpi=(DPI, DPI), optimize=False, compress_level=1)
     print(f"  Successfully saved sheet: {output_path_for_sheet}")
   except Exception as e:
     print(f"  Error saving sheet {output_path_for_sheet}: {e}")
 
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\s\.]+')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
 def sanitize_filename_component(name_component):
-  name_component = os.path.basename(name_component) 
-  name_component = os.path.splitext(name_component)[0] 
-  invalid_chars = r'[<>:"/\\|?*\s\.]+' 
-  sanitized = re.sub(invalid_chars, '_', name_component)
-  sanitized = re.sub(r'_+', '_', sanitized) 
-  sanitized = sanitized.strip('_') 
+  name_component = os.path.basename(name_component)
+  name_component = os.path.splitext(name_component)[0]
+  sanitized = _INVALID_FILENAME_CHARS_RE.sub('_', name_component)
+  sanitized = _MULTI_UNDERSCORE_RE.sub('_', sanitized)
+  sanitized = sanitized.strip('_')
   return sanitized if sanitized else "file"
 
 if __name__ == "__main__":